@@ -1,15 +1,30 @@
 from gevent import monkey
 monkey.patch_all()  # Enables websocket to handle multiple connections effectively
+from psycogreen.gevent import patch_psycopg
+patch_psycopg()  # Makes psycopg2 yield to other green threads while waiting on Postgres
 
-from flask import Flask, jsonify, request
+from flask import Flask, g, jsonify, request, Response, stream_with_context
+import hashlib
+import logging
+import orjson
 import random
 import requests
 import os
+import threading
 import uuid
-from sqlalchemy import create_engine, MetaData
-from mq import publish_event
+from cachetools import TTLCache
+from sqlalchemy import (create_engine, MetaData, Table, Column, Integer,
+                        String, Boolean, ForeignKey, select, func, literal,
+                        bindparam, text)
+from sqlalchemy.dialects.postgresql import insert as pg_insert, UUID
+from sqlalchemy.exc import IntegrityError, OperationalError
+from mq import publish_event, uuid4_str
 from flask_socketio import SocketIO, join_room, leave_room, emit
 
+logging.basicConfig(level=logging.INFO,
+                    format="%(asctime)s %(levelname)s %(name)s %(message)s")
+log = logging.getLogger(__name__)
+
 app = Flask(__name__)
 
 # Database connection setup
@@ -17,44 +32,216 @@ app.config["DATABASE_URL"] = os.getenv("DATABASE_URI")
 if not app.config["DATABASE_URL"]:
     raise RuntimeError("DATABASE_URL not set")
 
-engine = create_engine(app.config["DATABASE_URL"])
+# Pool sized for gunicorn workers * threads; pre-ping drops stale sockets
+# after Postgres idle timeouts, recycle caps connection age at 30 minutes.
+engine = create_engine(
+    app.config["DATABASE_URL"],
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    executemany_mode="values_plus_batch",  # pipeline multi-row statements into one round trip
+    query_cache_size=1200,
+    future=True,
+)
+# Table definitions mirror docs/schema.sql. Declaring them here instead of
+# reflecting means process start does no pg_catalog introspection queries
+# (reflection ran once per gunicorn worker and slowed cold starts).
 metadata = MetaData()
-metadata.reflect(bind=engine)  # Auto-load existing tables from database
 
-# Get the positions table and nominations table
-positions_table = metadata.tables['positions']
-nominations_table = metadata.tables['nominations']
+positions_table = Table(
+    "positions", metadata,
+    Column("position_id", Integer, primary_key=True),
+    Column("meeting_id", UUID(as_uuid=True), nullable=False),
+    Column("agenda_item_id", String(255)),
+    Column("position_name", String(255), nullable=False),
+    Column("is_open", Boolean, nullable=False),
+    Column("poll_id", String(36))
+)
+
+nominations_table = Table(
+    "nominations", metadata,
+    Column("position_id", Integer,
+           ForeignKey("positions.position_id", ondelete="CASCADE"),
+           primary_key=True),
+    Column("username", String(255), primary_key=True),
+    Column("accepted", Boolean, nullable=False)
+)
+
+# ---------------------------
+# Precompiled statements
+# ---------------------------
+# Built once at import so handlers only bind parameters per request instead
+# of reconstructing the same expression trees; the rendered SQL stays hot in
+# the engine's compiled cache.
+
+SELECT_POSITION = positions_table.select().where(
+    positions_table.c.position_id == bindparam('pid')
+)
+
+SELECT_NOMINATIONS = nominations_table.select().where(
+    nominations_table.c.position_id == bindparam('pid')
+)
+
+SELECT_NOMINATION_STATUS = nominations_table.select().where(
+    (nominations_table.c.position_id == bindparam('pid')) &
+    (nominations_table.c.username == bindparam('u'))
+)
+
+# Position row plus its accepted candidates aggregated into one array column
+SELECT_POSITION_WITH_CANDIDATES = select(
+    positions_table.c.meeting_id,
+    positions_table.c.position_name,
+    positions_table.c.is_open,
+    select(
+        func.array_agg(nominations_table.c.username)
+    ).where(
+        (nominations_table.c.position_id == bindparam('pid')) &
+        (nominations_table.c.accepted == True)
+    ).scalar_subquery().label("candidates")
+).where(positions_table.c.position_id == bindparam('pid'))
+
+CLOSE_POSITION = positions_table.update().where(
+    (positions_table.c.position_id == bindparam('pid')) &
+    (positions_table.c.is_open == True)
+).values(
+    is_open=False,
+    poll_id=bindparam('poll')
+).returning(positions_table.c.position_id)  # only needed for the raced-close check
+
+ACCEPT_NOMINATION = nominations_table.update().where(
+    (nominations_table.c.position_id == bindparam('pid')) &
+    (nominations_table.c.username == bindparam('u'))
+).values(accepted=True)
+
+# Whole batch in one statement: UNNEST expands the username array server-side,
+# so a 1000-row import is one round trip instead of 1000 INSERTs
+BULK_NOMINATE = text("""
+    INSERT INTO nominations (position_id, username, accepted)
+    SELECT :pid, u, FALSE
+    FROM unnest(CAST(:usernames AS text[])) AS u
+    WHERE EXISTS (
+        SELECT 1 FROM positions
+        WHERE position_id = :pid AND is_open = TRUE
+    )
+    ON CONFLICT (position_id, username) DO NOTHING
+""")
 
 # Initialize SocketIO
 socketio = SocketIO(app, cors_allowed_origins="*",
                     message_queue=os.getenv("REDIS_URL", None),
                     async_mode='gevent')
 
+# ---------------------------
+# Response cache
+# ---------------------------
+# Polling dashboards re-request the same position/nomination lists far more
+# often than they change, so serialized bodies are cached for a few seconds
+# keyed by the query filters. Write endpoints evict the affected keys, and
+# each cached body carries its ETag so a repeat poll can be answered with
+# 304 without touching Postgres. Per-process only; cross-worker staleness
+# is bounded by the TTL.
+_response_cache = TTLCache(maxsize=1024, ttl=5)
+# Bodies above this size stream through without being buffered for the cache;
+# TTLCache's maxsize caps entry count, not bytes, so this bounds worst-case
+# memory at maxsize * cap
+_CACHE_MAX_BODY_BYTES = 256 * 1024
+# Generation counters guard against a read/write race: a body is stored only
+# if no invalidation ran between the start of the read and the end of the
+# stream, otherwise the pre-write body would be cached after the eviction
+_cache_generations = {}
+_cache_lock = threading.Lock()
+
+def _gen_key(cache_key):
+    # positions entries are invalidated as a group, so they share one counter
+    return "positions" if cache_key[0] == "positions" else cache_key
+
+def cache_generation(cache_key):
+    """Snapshot the invalidation counter for cache_key at the start of a read."""
+    with _cache_lock:
+        return _cache_generations.get(_gen_key(cache_key), 0)
+
+def cached_json_response(cache_key):
+    """Return a cached response for cache_key (304 if the ETag matches), or None."""
+    with _cache_lock:
+        entry = _response_cache.get(cache_key)
+    if entry is None:
+        return None
+    body, etag = entry
+    response = app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def cache_response(cache_key, body, generation):
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    with _cache_lock:
+        if _cache_generations.get(_gen_key(cache_key), 0) != generation:
+            return  # a write invalidated this key while we were streaming
+        _response_cache[cache_key] = (body, etag)
+
+def invalidate_positions_cache():
+    # Filtered and unfiltered listings can all contain the changed position,
+    # so drop every positions entry; writes are rare next to reads
+    with _cache_lock:
+        _cache_generations["positions"] = _cache_generations.get("positions", 0) + 1
+        for key in [k for k in _response_cache if k[0] == "positions"]:
+            del _response_cache[key]
+
+def invalidate_nominations_cache(position_id):
+    key = ("nominations", position_id)
+    with _cache_lock:
+        _cache_generations[key] = _cache_generations.get(key, 0) + 1
+        _response_cache.pop(key, None)
+
+# ---------------------------
+# Database connection per request
+# ---------------------------
+# One pool checkout per request instead of one per with-block, so handlers
+# that run several queries share a single connection and transaction.
+
+def get_conn():
+    """Return the request-scoped connection, checking one out on first use."""
+    if "conn" not in g:
+        g.conn = engine.connect()
+    return g.conn
+
+@app.teardown_request
+def close_conn(exc):
+    conn = g.pop("conn", None)
+    if conn is not None:
+        try:
+            if exc is None:
+                conn.commit()
+            else:
+                conn.rollback()
+        finally:
+            conn.close()
+
 # ---------------------------
 # SocketIO Events
 # ---------------------------
 
 @socketio.on('connect')
 def on_connect():
-    print("Client connected to ElectionService")
+    log.info("Client connected to ElectionService")
 
 @socketio.on('disconnect')
 def on_disconnect():
-    print("Client disconnected from ElectionService")
+    log.info("Client disconnected from ElectionService")
 
 @socketio.on('join_election')
 def on_join_election(data):
     meeting_id = data.get('meeting_id')
     if meeting_id:
         join_room(meeting_id)
-        print(f"Client joined election room: {meeting_id}")
+        log.info("Client joined election room: %s", meeting_id)
 
 @socketio.on('leave_election')
 def on_leave_election(data):
     meeting_id = data.get('meeting_id')
     if meeting_id:
         leave_room(meeting_id)
-        print(f"Client left election room: {meeting_id}")
+        log.info("Client left election room: %s", meeting_id)
 
 # ---------------------------
 # API Routes
@@ -64,6 +251,69 @@ def on_leave_election(data):
 def root():
     return "ElectionService API running"
 
+def json_response_with_etag(payload):
+    """
+    Serialize payload to JSON with an ETag header.
+    Returns 304 Not Modified without a body when the client's If-None-Match
+    matches, so polling frontends stop paying for unchanged responses.
+    """
+    body = orjson.dumps(payload)
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    response = app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def stream_json_rows(conn, select_stmt, params=None, cache_key=None):
+    """
+    Stream a result set as a JSON array, one row at a time.
+    Uses a server-side cursor so memory stays flat no matter how many rows
+    match, and the first byte goes out after one round trip. Rows are read
+    through their zero-copy _mapping view (column name -> value, matching
+    the API response shape) and serialized with orjson, so there is no
+    per-row attribute-lookup loop. The request-scoped connection stays open
+    until teardown, after the stream finishes (stream_with_context keeps
+    the request context alive that long).
+
+    The statement is executed - and the first batch fetched - before the
+    Response exists, so query errors (bad SQL, dead connection) surface as a
+    normal error response instead of aborting an already-started 200 stream.
+    """
+    generation = cache_generation(cache_key) if cache_key is not None else 0
+    result = iter(conn.execute(select_stmt, params or {}).mappings())
+    first_row = next(result, None)
+
+    def generate():
+        # Chunks are collected as they stream out so the finished body can be
+        # cached for the next poll of the same key - up to a size cap, so a
+        # large result set streams without being duplicated in memory
+        chunks = [b"["]
+        size = 1
+
+        def remember(chunk):
+            nonlocal chunks, size
+            if chunks is None:
+                return
+            size += len(chunk)
+            if size > _CACHE_MAX_BODY_BYTES:
+                chunks = None  # too big to cache; stop buffering
+            else:
+                chunks.append(chunk)
+
+        yield b"["
+        if first_row is not None:
+            chunk = orjson.dumps(dict(first_row))
+            remember(chunk)
+            yield chunk
+            for row in result:
+                chunk = b"," + orjson.dumps(dict(row))
+                remember(chunk)
+                yield chunk
+        remember(b"]")
+        yield b"]"
+        if cache_key is not None and chunks is not None:
+            cache_response(cache_key, b"".join(chunks), generation)
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
 def create_poll_in_voting_service(meeting_id, position_name, accepted_candidates):
     """
     Create a poll in the voting service for the accepted candidates.
@@ -71,7 +321,7 @@ def create_poll_in_voting_service(meeting_id, position_name, accepted_candidates
     Returns the poll_id (UUID) if successful, None otherwise.
     """
     # Generate a unique poll_id
-    poll_id = str(uuid.uuid4())
+    poll_id = uuid4_str()
     
     # Prepare the poll data
     vote_data = {
@@ -88,13 +338,12 @@ def create_poll_in_voting_service(meeting_id, position_name, accepted_candidates
             data={"vote": vote_data}
         )
         
-        print(f"Successfully published voting.create event for poll {poll_id} for position '{position_name}'")
+        log.info("Published voting.create event for poll %s for position '%s'",
+                 poll_id, position_name)
         return poll_id
-        
-    except Exception as e:
-        print(f"Error publishing poll creation event: {e}")
-        import traceback
-        traceback.print_exc()
+
+    except Exception:
+        log.exception("Error publishing poll creation event for poll %s", poll_id)
         return None
 
 #--------------------
@@ -125,18 +374,18 @@ def create_position():
         return jsonify({"error": "meeting_id and position_name are required"}), 400
     
     # Insert into PostgreSQL database
-    with engine.connect() as conn:
-        insert_stmt = positions_table.insert().values(
-            meeting_id=meeting_id,
-            agenda_item_id=agenda_item_id,
-            position_name=position_name,
-            is_open=True
-        )
-        result = conn.execute(insert_stmt)
-        conn.commit()
-        
-        # Get the auto-generated position_id
-        position_id = result.inserted_primary_key[0]
+    insert_stmt = positions_table.insert().values(
+        meeting_id=meeting_id,
+        agenda_item_id=agenda_item_id,
+        position_name=position_name,
+        is_open=True
+    )
+    result = get_conn().execute(insert_stmt)
+
+    # Get the auto-generated position_id
+    position_id = result.inserted_primary_key[0]
+
+    invalidate_positions_cache()
 
     created_position = {
         "position_id": position_id,
@@ -161,33 +410,31 @@ def get_positions():
     """
     meeting_id = request.args.get('meeting_id')
     agenda_item_id = request.args.get('agenda_item_id')
-    
-    with engine.connect() as conn:
-        # Build query with optional filters
-        select_stmt = positions_table.select()
-        
-        if meeting_id:
-            select_stmt = select_stmt.where(positions_table.c.meeting_id == meeting_id)
-        
-        if agenda_item_id:
-            select_stmt = select_stmt.where(positions_table.c.agenda_item_id == agenda_item_id)
-        
-        rows = conn.execute(select_stmt).fetchall()
-        
-        # Convert rows to list of dictionaries
-        positions_list = [
-            {
-                "position_id": row.position_id,
-                "meeting_id": row.meeting_id,
-                "agenda_item_id": row.agenda_item_id if hasattr(row, 'agenda_item_id') else None,
-                "position_name": row.position_name,
-                "is_open": row.is_open,
-                "poll_id": row.poll_id if hasattr(row, 'poll_id') else None
-            }
-            for row in rows
-        ]
-
-    return jsonify(positions_list), 200
+
+    # Validate up front; a malformed value would otherwise only fail once
+    # Postgres rejects it for the UUID-typed column
+    if meeting_id:
+        try:
+            uuid.UUID(meeting_id)
+        except ValueError:
+            return jsonify({"error": "meeting_id must be a valid UUID"}), 400
+
+    cache_key = ("positions", meeting_id, agenda_item_id)
+    cached = cached_json_response(cache_key)
+    if cached is not None:
+        return cached
+
+    # Build query with optional filters
+    select_stmt = positions_table.select()
+
+    if meeting_id:
+        select_stmt = select_stmt.where(positions_table.c.meeting_id == meeting_id)
+
+    if agenda_item_id:
+        select_stmt = select_stmt.where(positions_table.c.agenda_item_id == agenda_item_id)
+
+    conn = get_conn().execution_options(stream_results=True, yield_per=500)
+    return stream_json_rows(conn, select_stmt, cache_key=cache_key)
 
 @app.route("/positions/<int:position_id>/close", methods=["POST"])
 def close_position(position_id):
@@ -195,71 +442,59 @@ def close_position(position_id):
     POST /positions/{position_id}/close
     Close a position for nominations and create a poll in voting service.
     """
-    with engine.connect() as conn:
-        # First, fetch the position to get its details
-        select_position_stmt = positions_table.select().where(
-            positions_table.c.position_id == position_id
-        )
-        position = conn.execute(select_position_stmt).fetchone()
-        
-        if position is None:
-            return jsonify({"error": "Could not find position with the provided id"}), 404
-        
-        if not position.is_open:
-            return jsonify({"error": "Position is already closed"}), 400
-        
-        # Get all accepted nominations for this position
-        select_nominations_stmt = nominations_table.select().where(
-            (nominations_table.c.position_id == position_id) &
-            (nominations_table.c.accepted == True)
-        )
-        accepted_nominations = conn.execute(select_nominations_stmt).fetchall()
-        
-        # Check if there are at least 2 accepted candidates
-        if len(accepted_nominations) < 2:
-            return jsonify({
-                "error": "Cannot close position with fewer than 2 accepted candidates. Need at least 2 candidates to create a poll."
-            }), 400
-        
-        # Extract candidate usernames
-        accepted_candidates = [nom.username for nom in accepted_nominations]
-        
-        # Create poll in voting service
-        poll_id = create_poll_in_voting_service(
-            meeting_id=position.meeting_id,
-            position_name=position.position_name,
-            accepted_candidates=accepted_candidates
-        )
-        
-        if poll_id is None:
-            return jsonify({
-                "error": "Failed to create poll in voting service. Position not closed."
-            }), 500
-        
-        # UPDATE the position to set is_open = False and store poll_id
-        update_stmt = positions_table.update().where(
-            positions_table.c.position_id == position_id
-        ).values(
-            is_open=False,
-            poll_id=poll_id
-        )
-        conn.execute(update_stmt)
-        conn.commit()
-        
-        # Fetch the updated position to return it
-        select_stmt = positions_table.select().where(
-            positions_table.c.position_id == position_id
-        )
-        row = conn.execute(select_stmt).fetchone()
-        
-        closed_position = {
-            "position_id": row.position_id,
-            "meeting_id": str(row.meeting_id),
-            "position_name": row.position_name,
-            "is_open": row.is_open,
-            "poll_id": str(poll_id),
-            "candidates": accepted_candidates
-        }
+    conn = get_conn()
+
+    # Fetch the position and its accepted candidates in one round trip
+    position = conn.execute(
+        SELECT_POSITION_WITH_CANDIDATES, {"pid": position_id}
+    ).fetchone()
+
+    if position is None:
+        return jsonify({"error": "Could not find position with the provided id"}), 404
+
+    if not position.is_open:
+        return jsonify({"error": "Position is already closed"}), 400
+
+    accepted_candidates = list(position.candidates or [])
+
+    # Check if there are at least 2 accepted candidates
+    if len(accepted_candidates) < 2:
+        return jsonify({
+            "error": "Cannot close position with fewer than 2 accepted candidates. Need at least 2 candidates to create a poll."
+        }), 400
+
+    # Create poll in voting service
+    poll_id = create_poll_in_voting_service(
+        meeting_id=position.meeting_id,
+        position_name=position.position_name,
+        accepted_candidates=accepted_candidates
+    )
+
+    if poll_id is None:
+        return jsonify({
+            "error": "Failed to create poll in voting service. Position not closed."
+        }), 500
+
+    # Close the position and get the updated row back in the same round
+    # trip; the is_open guard makes a concurrent close lose cleanly.
+    row = conn.execute(CLOSE_POSITION, {"pid": position_id, "poll": poll_id}).fetchone()
+
+    if row is None:
+        # Another request closed the position between our read and update
+        return jsonify({"error": "Position is already closed"}), 400
+
+    invalidate_positions_cache()
+
+    # Every response field is already known locally; no need to read the
+    # updated row back
+    closed_position = {
+        "position_id": position_id,
+        "meeting_id": str(position.meeting_id),
+        "position_name": position.position_name,
+        "is_open": False,
+        "poll_id": str(poll_id),
+        "candidates": accepted_candidates
+    }
 
     # Emit WebSocket event to notify clients that position is closed and voting started
     socketio.emit('position_closed', {
@@ -282,37 +517,51 @@ def nominate_candidate(position_id):
     if not username:
         return jsonify({"error": "username is required"}), 400
     
-    # Insert into nominations_table (not positions_table!)
-    with engine.connect() as conn:
-        # Check if position exists and is open
-        check_stmt = positions_table.select().where(
-            positions_table.c.position_id == position_id
+    # Single statement: the SELECT guard only yields a row while the
+    # position exists and is open, ON CONFLICT swallows duplicates, and
+    # RETURNING tells us whether a row was actually inserted.
+    insert_stmt = pg_insert(nominations_table).from_select(
+        ["position_id", "username", "accepted"],
+        select(
+            positions_table.c.position_id,
+            literal(username),
+            literal(False)
+        ).where(
+            (positions_table.c.position_id == position_id) &
+            (positions_table.c.is_open == True)
         )
-        position = conn.execute(check_stmt).fetchone()
-        
+    ).on_conflict_do_nothing(
+        index_elements=["position_id", "username"]
+    ).returning(nominations_table.c.position_id)
+
+    for attempt in range(2):
+        conn = get_conn()
+        try:
+            inserted = conn.execute(insert_stmt).fetchone()
+
+            # Get position details for the WebSocket event; on the miss path
+            # this also tells a missing position apart from a closed one
+            position = conn.execute(SELECT_POSITION, {"pid": position_id}).fetchone()
+            break
+        except IntegrityError:
+            # ON CONFLICT covers the primary key; this only fires for races
+            # the statement cannot absorb (e.g. the position row vanishing)
+            return jsonify({"error": "Nomination already exists for this user and position"}), 409
+        except OperationalError as e:
+            # Connection died mid-request: drop the dead checkout and retry
+            # once on a fresh one
+            if not e.connection_invalidated or attempt == 1:
+                raise
+            g.pop("conn").close()
+
+    if inserted is None:
         if position is None:
             return jsonify({"error": "Could not find position with the provided id"}), 404
-        
         if not position.is_open:
             return jsonify({"error": "Position is closed for nominations"}), 400
-        
-        # Insert the nomination (position_id + username is the primary key)
-        insert_stmt = nominations_table.insert().values(
-            position_id=position_id,
-            username=username,
-            accepted=False  # default value
-        )
-        
-        try:
-            conn.execute(insert_stmt)
-            conn.commit()
-        except Exception as e:
-            # Handle duplicate nomination (same user, same position)
-            return jsonify({"error": "Nomination already exists for this user and position"}), 409
+        return jsonify({"error": "Nomination already exists for this user and position"}), 409
 
-        # Get position details for WebSocket event
-        position_stmt = positions_table.select().where(positions_table.c.position_id == position_id)
-        position = conn.execute(position_stmt).fetchone()
+    invalidate_nominations_cache(position_id)
 
     nomination = {
         "position_id": position_id,
@@ -330,29 +579,65 @@ def nominate_candidate(position_id):
 
     return jsonify(nomination), 201
 
+@app.route("/positions/<int:position_id>/nominations/bulk", methods=["POST"])
+def bulk_nominate_candidates(position_id):
+    """
+    POST /positions/{position_id}/nominations/bulk
+    Nominate many candidates for a position in one request (e.g. CSV import).
+    Request body: {"usernames": ["alice", "bob"]}
+    """
+    data = request.get_json()
+    usernames = data.get('usernames')
+
+    if not usernames or not isinstance(usernames, list):
+        return jsonify({"error": "usernames must be a non-empty list"}), 400
+
+    conn = get_conn()
+    result = conn.execute(BULK_NOMINATE, {"pid": position_id, "usernames": usernames})
+
+    # Get position details for the WebSocket event; on a full miss this also
+    # tells a missing position apart from a closed one
+    position = conn.execute(SELECT_POSITION, {"pid": position_id}).fetchone()
+
+    if result.rowcount == 0:
+        if position is None:
+            return jsonify({"error": "Could not find position with the provided id"}), 404
+        if not position.is_open:
+            return jsonify({"error": "Position is closed for nominations"}), 400
+        # All names were already nominated; nothing new to insert
+
+    invalidate_nominations_cache(position_id)
+
+    bulk_result = {
+        "position_id": position_id,
+        "usernames": usernames,
+        "inserted": result.rowcount
+    }
+
+    # Emit WebSocket event to notify clients of the new nominations
+    socketio.emit('nominations_added', {
+        "meeting_id": str(position.meeting_id),
+        "position_id": position_id,
+        "usernames": usernames
+    }, room=str(position.meeting_id))
+
+    return jsonify(bulk_result), 201
+
 @app.route("/positions/<int:position_id>/nominations", methods=["GET"])
 def get_nominations(position_id):
     """
     GET /positions/{position_id}/nominations
     Retrieve all nominations for a position.
     """
-    with engine.connect() as conn:
-        # Fetch ALL nominations for given position
-        select_stmt = nominations_table.select().where(
-            nominations_table.c.position_id == position_id
-        )
-        rows = conn.execute(select_stmt).fetchall()
-        
-        nominations = [
-            {
-                "position_id": row.position_id,
-                "username": row.username,
-                "accepted": row.accepted
-            }
-            for row in rows
-        ]
+    cache_key = ("nominations", position_id)
+    cached = cached_json_response(cache_key)
+    if cached is not None:
+        return cached
 
-    return jsonify(nominations), 200
+    # Stream ALL nominations for given position
+    conn = get_conn().execution_options(stream_results=True, yield_per=500)
+    return stream_json_rows(conn, SELECT_NOMINATIONS, params={"pid": position_id},
+                            cache_key=cache_key)
 
 @app.route("/positions/<int:position_id>/nominations/<string:username>/status", methods=["GET"])
 def get_nomination_status_for_candidate(position_id, username):
@@ -360,25 +645,14 @@ def get_nomination_status_for_candidate(position_id, username):
     GET /positions/{position_id}/nominations/{candidate_name}/status
     Retrieve the nomination status for a candidate.
     """
-    with engine.connect() as conn:
-        # Fetch nomination for given position and candidate
-        select_stmt = nominations_table.select().where(
-            (nominations_table.c.position_id == position_id) &
-            (nominations_table.c.username == username)
-        )
-        rows = conn.execute(select_stmt).fetchall()
-        
-        # Convert rows to list of dictionaries
-        nominations = [
-            {
-                "position_id": row.position_id,
-                "username": row.username,
-                "accepted": row.accepted
-            }
-            for row in rows
-        ]
-
-    return jsonify(nominations), 200
+    # Fetch nomination for given position and candidate; the mapping view
+    # already has the response shape (column name -> value)
+    rows = get_conn().execute(
+        SELECT_NOMINATION_STATUS, {"pid": position_id, "u": username}
+    ).mappings().all()
+    nominations = [dict(row) for row in rows]
+
+    return json_response_with_etag(nominations)
 
 @app.route("/positions/<int:position_id>/nominations/<string:candidate_name>/accept", methods=["POST"])
 def accept_nomination(position_id, candidate_name):
@@ -387,23 +661,17 @@ def accept_nomination(position_id, candidate_name):
     Accept a candidate's nomination.
     """
     # UPDATE the existing nomination to set accepted = True
-    with engine.connect() as conn:
-        update_stmt = nominations_table.update().where(
-            (nominations_table.c.position_id == position_id) &
-            (nominations_table.c.username == candidate_name)
-        ).values(
-            accepted=True
-        )
-        result = conn.execute(update_stmt)
-        conn.commit()
-        
-        # Check if nomination was found and updated
-        if result.rowcount == 0:
-            return jsonify({"error": "Could not find nomination for this candidate and position"}), 404
+    conn = get_conn()
+    result = conn.execute(ACCEPT_NOMINATION, {"pid": position_id, "u": candidate_name})
+
+    # Check if nomination was found and updated
+    if result.rowcount == 0:
+        return jsonify({"error": "Could not find nomination for this candidate and position"}), 404
 
-        # Get position details for WebSocket event
-        position_stmt = positions_table.select().where(positions_table.c.position_id == position_id)
-        position = conn.execute(position_stmt).fetchone()
+    # Get position details for WebSocket event
+    position = conn.execute(SELECT_POSITION, {"pid": position_id}).fetchone()
+
+    invalidate_nominations_cache(position_id)
 
     accepted_nomination = {
         "position_id": position_id,
@@ -421,6 +689,53 @@ def accept_nomination(position_id, candidate_name):
 
     return jsonify(accepted_nomination), 200
 
+@app.route("/positions/<int:position_id>/nominations/bulk_accept", methods=["POST"])
+def bulk_accept_nominations(position_id):
+    """
+    POST /positions/{position_id}/nominations/bulk_accept
+    Accept several candidates' nominations in one request.
+    Request body: {"usernames": ["alice", "bob"]}
+    """
+    data = request.get_json()
+    usernames = data.get('usernames')
+
+    if not usernames or not isinstance(usernames, list):
+        return jsonify({"error": "usernames must be a non-empty list"}), 400
+
+    # One UPDATE for the whole batch instead of a round trip per candidate
+    conn = get_conn()
+    update_stmt = nominations_table.update().where(
+        (nominations_table.c.position_id == position_id) &
+        (nominations_table.c.username.in_(usernames))
+    ).values(
+        accepted=True
+    )
+    result = conn.execute(update_stmt)
+
+    if result.rowcount == 0:
+        return jsonify({"error": "Could not find nominations for these candidates and position"}), 404
+
+    # Get position details for WebSocket event
+    position = conn.execute(SELECT_POSITION, {"pid": position_id}).fetchone()
+
+    invalidate_nominations_cache(position_id)
+
+    accepted_nominations = {
+        "position_id": position_id,
+        "candidate_names": usernames,
+        "accepted_count": result.rowcount
+    }
+
+    # Emit WebSocket event to notify clients of accepted nominations
+    if position:
+        socketio.emit('nominations_accepted', {
+            "meeting_id": str(position.meeting_id),
+            "position_id": position_id,
+            "candidate_names": usernames
+        }, room=str(position.meeting_id))
+
+    return jsonify(accepted_nominations), 200
+
 
 if __name__ == '__main__':
 	socketio.run(app, host='0.0.0.0', port=80)
\ No newline at end of file
@@ -22,3 +22,9 @@ CREATE TABLE nominations (
             REFERENCES positions(position_id)
             ON DELETE CASCADE
 );
+
+-- Indexes for the hot query paths:
+-- close_position filters nominations by position and accepted flag (partial
+-- index keeps it small), get_positions filters by meeting and agenda item.
+CREATE INDEX ix_nominations_pid_accepted ON nominations (position_id) WHERE accepted;
+CREATE INDEX ix_positions_meeting_agenda ON positions (meeting_id, agenda_item_id);
@@ -1,34 +1,126 @@
-import os, json, uuid
+import os, atexit, logging, queue, threading
 from datetime import datetime, timezone
+import orjson
 import pika
 
+log = logging.getLogger(__name__)
+
 EXCHANGE = os.getenv("MQ_EXCHANGE", "events")
 EXCHANGE_TYPE = os.getenv("MQ_EXCHANGE_TYPE", "topic")
 
+# Publishing happens on a dedicated daemon thread fed by an in-memory queue,
+# so HTTP handlers enqueue and return without blocking on RabbitMQ I/O.
+# The publisher thread is the only owner of the connection/channel, which
+# also sidesteps pika's lack of thread safety.
+_PUBLISH_QUEUE = queue.Queue()
+_SHUTDOWN = object()
+
+_connection = None
+_channel = None
+
+
+def uuid4_str() -> str:
+    """
+    Random version-4 UUID as its canonical string, built straight from
+    os.urandom bytes. Skips the uuid.UUID constructor overhead, which adds
+    up at high event rates.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 def _conn():
-    return pika.BlockingConnection(pika.URLParameters(os.environ["AMQP_URL"]))
+    params = pika.URLParameters(os.environ["AMQP_URL"])
+    params.heartbeat = 30
+    params.blocked_connection_timeout = 10
+    return pika.BlockingConnection(params)
 
-def publish_event(routing_key: str, data: dict, *, event_version: int = 1):
-    connection = _conn()
-    ch = connection.channel()
-    ch.exchange_declare(exchange=EXCHANGE, exchange_type=EXCHANGE_TYPE, durable=True)
 
-    event = {
-        "event_type": routing_key,
-        "event_version": event_version,
-        "event_id": str(uuid.uuid4()),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "producer": os.getenv("SERVICE_NAME", "election-service"),
-        "data": data,
-    }
+def _get_channel():
+    """Return the cached channel, (re)connecting and declaring the exchange if needed."""
+    global _connection, _channel
+    if (_connection is None or _connection.is_closed
+            or _channel is None or _channel.is_closed):
+        _connection = _conn()
+        _channel = _connection.channel()
+        _channel.exchange_declare(exchange=EXCHANGE, exchange_type=EXCHANGE_TYPE, durable=True)
+        # Publisher confirms: the broker acks each publish, so a lost message
+        # surfaces as an exception here instead of disappearing silently.
+        _channel.confirm_delivery()
+    return _channel
+
+
+def _reset():
+    """Drop the cached connection/channel so the next publish reconnects."""
+    global _connection, _channel
+    try:
+        if _connection is not None and _connection.is_open:
+            _connection.close()
+    except Exception:
+        pass
+    _connection = None
+    _channel = None
+
 
-    ch.basic_publish(
+def _publish(body: bytes, routing_key: str):
+    _get_channel().basic_publish(
         exchange=EXCHANGE,
         routing_key=routing_key,
-        body=json.dumps(event).encode("utf-8"),
+        body=body,
         properties=pika.BasicProperties(
             content_type="application/json",
             delivery_mode=2,
         ),
     )
-    connection.close()
+
+
+def _publisher_loop():
+    while True:
+        item = _PUBLISH_QUEUE.get()
+        if item is _SHUTDOWN:
+            _reset()
+            _PUBLISH_QUEUE.task_done()
+            return
+        body, routing_key = item
+        try:
+            try:
+                _publish(body, routing_key)
+            except (pika.exceptions.AMQPConnectionError,
+                    pika.exceptions.ChannelWrongStateError,
+                    pika.exceptions.StreamLostError,
+                    pika.exceptions.NackError):
+                # Stale connection or broker nack: reconnect and retry once
+                _reset()
+                _publish(body, routing_key)
+        except Exception:
+            log.exception("Failed to publish %s event", routing_key)
+        finally:
+            _PUBLISH_QUEUE.task_done()
+
+
+_publisher = threading.Thread(target=_publisher_loop, name="mq-publisher", daemon=True)
+_publisher.start()
+
+
+def publish_event(routing_key: str, data: dict, *, event_version: int = 1):
+    """Serialize the event and hand it to the publisher thread. Returns immediately."""
+    event = {
+        "event_type": routing_key,
+        "event_version": event_version,
+        "event_id": uuid4_str(),
+        # orjson serializes the datetime itself; OPT_UTC_Z keeps the Z suffix
+        "timestamp": datetime.now(timezone.utc),
+        "producer": os.getenv("SERVICE_NAME", "election-service"),
+        "data": data,
+    }
+    _PUBLISH_QUEUE.put((orjson.dumps(event, option=orjson.OPT_UTC_Z), routing_key))
+
+
+@atexit.register
+def _close_on_exit():
+    # Give the publisher a chance to drain pending events before exit
+    _PUBLISH_QUEUE.put(_SHUTDOWN)
+    _publisher.join(timeout=5)